@@ -15,7 +15,6 @@
 
 """Adders that use Reverb (github.com/deepmind/reverb) as a backend."""
 
-import copy
 from typing import (
     Any,
     Callable,
@@ -220,7 +219,12 @@ class ReverbParallelAdder(ReverbAdder, ParallelAdder):
                 # form it for each table. Therefore each table starts with
                 # a fresh copy of all the agents and removes agents as it
                 # pushes the experience to its table.
-                trajectory_dict_copy = copy.deepcopy(trajectory_nets_agent)
+                # Only the agent lists are popped from, so copying them is
+                # enough (agent keys are immutable strings).
+                trajectory_dict_copy = {
+                    net_key: list(net_agents)
+                    for net_key, net_agents in trajectory_nets_agent.items()
+                }
 
                 # While the networks are in the data keep creating tables
                 # Each training example can therefore create multiple items
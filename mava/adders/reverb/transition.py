@@ -210,13 +210,13 @@ class ParallelNStepTransitionAdder(NStepTransitionAdder, ReverbParallelAdder):
     def signature(
         cls,
         environment_spec: mava_specs.EnvironmentSpec,
-        extras_spec: tf.TypeSpec = {},
+        extras_spec: Optional[tf.TypeSpec] = None,
     ) -> tf.TypeSpec:
         """Signature for adder.
 
         Args:
             environment_spec (mava_specs.EnvironmentSpec): MA environment spec.
-            extras_spec (tf.TypeSpec, optional): Spec for extras data. Defaults to {}.
+            extras_spec (tf.TypeSpec, optional): Spec for extras data. Defaults to None.
 
         Returns:
             tf.TypeSpec: Signature for transition adder.
@@ -235,6 +235,8 @@ class ParallelNStepTransitionAdder(NStepTransitionAdder, ReverbParallelAdder):
         agent_specs = environment_spec.get_agent_specs()
         agents = environment_spec.get_agent_ids()
         env_extras_spec = environment_spec.get_extra_specs()
+        # Copy so that neither the caller's spec nor a shared default is mutated.
+        extras_spec = dict(extras_spec) if extras_spec else {}
         extras_spec.update(env_extras_spec)
 
         obs_specs = {}
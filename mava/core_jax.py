@@ -24,6 +24,10 @@ from typing import Any, List
 class BaseSystem(abc.ABC):
     """Abstract system object."""
 
+    # The interface holds no state, so it should not force a __dict__ onto
+    # systems that declare their own __slots__.
+    __slots__ = ()
+
     @abc.abstractmethod
     def design(self) -> SimpleNamespace:
         """System design specifying the list of components to use.
@@ -14,7 +14,7 @@
 # limitations under the License.
 """MAD4PG system builder implementation."""
 
-from typing import Any, Dict, Type, Union
+from typing import Any, Dict, Optional, Type, Union
 
 from mava import core
 from mava.systems.tf import executors
@@ -33,7 +33,7 @@ class MAD4PGBuilder(MADDPGBuilder):
             Type[training.MAD4PGBaseRecurrentTrainer],
         ] = training.MAD4PGDecentralisedTrainer,
         executor_fn: Type[core.Executor] = executors.FeedForwardExecutor,
-        extra_specs: Dict[str, Any] = {},
+        extra_specs: Optional[Dict[str, Any]] = None,
     ):
         """Initialise the system.
 
@@ -89,6 +89,8 @@ class MAD4PG(MADDPG):
         learning_rate_scheduler_fn: Optional[Dict[str, Callable[[int], None]]] = None,
         termination_condition: Optional[Dict[str, int]] = None,
         evaluator_interval: Optional[dict] = None,
+        prefetch_to_device: Optional[str] = None,
+        num_parallel_calls: int = 12,
     ):
         """Initialise the system
 
@@ -186,6 +188,11 @@ class MAD4PG(MADDPG):
                 happen at every timestep.
                 E.g. to evaluate a system after every 100 executor episodes,
                 evaluator_interval = {"executor_episodes": 100}.
+            prefetch_to_device: optional device, e.g. "/GPU:0", to prefetch
+                sampled batches onto so that host to device copies overlap with
+                the trainer step. Defaults to None (host-side prefetch only).
+            num_parallel_calls: number of parallel replay sampling streams that
+                are interleaved to build the trainer dataset.
         """
 
         super().__init__(
@@ -228,4 +235,6 @@ class MAD4PG(MADDPG):
             learning_rate_scheduler_fn=learning_rate_scheduler_fn,
             termination_condition=termination_condition,
             evaluator_interval=evaluator_interval,
+            prefetch_to_device=prefetch_to_device,
+            num_parallel_calls=num_parallel_calls,
         )
@@ -19,6 +19,7 @@ import copy
 import dataclasses
 from typing import Any, Dict, Iterator, List, Optional, Type, Union
 
+import numpy as np
 import reverb
 import sonnet as snt
 import tensorflow as tf
@@ -63,6 +64,10 @@ class MADDPGConfig:
         discount: discount to use for TD updates.
         batch_size: batch size for updates.
         prefetch_size: size to prefetch from replay.
+        prefetch_to_device: optional device (e.g. "/GPU:0") to prefetch replay
+            batches onto, overlapping host to device copies with training.
+        num_parallel_calls: number of parallel replay sampling streams that are
+            interleaved to build the dataset.
         target_averaging: whether to use polyak averaging for target network updates.
         target_update_period: number of steps before target networks are updated.
         target_update_rate: update rate when using averaging.
@@ -71,7 +76,7 @@ class MADDPGConfig:
         min_replay_size: minimum replay size before updating.
         max_replay_size: maximum replay size.
         samples_per_insert: number of samples to take from replay for every insert
-            that is made.
+            that is made. If None, only a minimum replay size is enforced.
         n_step: number of steps to include prior to boostrapping.
         sequence_length: recurrent sequence rollout length.
         period: consecutive starting points for overlapping rollouts across a sequence.
@@ -111,6 +116,8 @@ class MADDPGConfig:
     discount: float = 0.99
     batch_size: int = 256
     prefetch_size: int = 4
+    prefetch_to_device: Optional[str] = None
+    num_parallel_calls: int = 12
     target_averaging: bool = False
     target_update_period: int = 100
     target_update_rate: Optional[float] = None
@@ -144,7 +151,7 @@ class MADDPGBuilder:
             Type[training.MADDPGBaseRecurrentTrainer],
         ] = training.MADDPGDecentralisedTrainer,
         executor_fn: Type[core.Executor] = MADDPGFeedForwardExecutor,
-        extra_specs: Dict[str, Any] = {},
+        extra_specs: Optional[Dict[str, Any]] = None,
     ):
         """Initialise the system.
         Args:
@@ -159,9 +166,10 @@ class MADDPGBuilder:
         """
 
         self._config = config
-        self._extra_specs = extra_specs
+        self._extra_specs = extra_specs if extra_specs is not None else {}
         self._agents = self._config.environment_spec.get_agent_ids()
         self._agent_types = self._config.environment_spec.get_agent_types()
+        self._sorted_agent_keys = sort_str_num(self._config.agent_net_keys.keys())
         self._trainer_fn = trainer_fn
         self._executor_fn = executor_fn
 
@@ -176,14 +184,21 @@ class MADDPGBuilder:
             updated environment spec.
         """
 
-        env_adder_spec: specs.MAEnvironmentSpec = copy.deepcopy(environment_spec)
-        keys = env_adder_spec._keys
-        for key in keys:
-            agent_spec = env_adder_spec._specs[key]
+        # Nothing to convert if no agent has a discrete action space.
+        if not any(
+            type(agent_spec.actions) == DiscreteArray
+            for agent_spec in environment_spec._specs.values()
+        ):
+            return environment_spec
+
+        # Only the action specs change, so the remaining specs are shared with
+        # the original environment spec instead of being deep copied.
+        agent_specs: Dict[str, EnvironmentSpec] = {}
+        for key, agent_spec in environment_spec._specs.items():
             if type(agent_spec.actions) == DiscreteArray:
                 num_actions = agent_spec.actions.num_values
-                minimum = [float("-inf")] * num_actions
-                maximum = [float("inf")] * num_actions
+                minimum = np.full((num_actions,), -np.inf, dtype=np.float32)
+                maximum = np.full((num_actions,), np.inf, dtype=np.float32)
                 new_act_spec = BoundedArray(
                     shape=(num_actions,),
                     minimum=minimum,
@@ -192,19 +207,26 @@ class MADDPGBuilder:
                     name="actions",
                 )
 
-                env_adder_spec._specs[key] = EnvironmentSpec(
+                agent_specs[key] = EnvironmentSpec(
                     observations=agent_spec.observations,
                     actions=new_act_spec,
                     rewards=agent_spec.rewards,
                     discounts=agent_spec.discounts,
                 )
-        return env_adder_spec
+            else:
+                agent_specs[key] = agent_spec
+
+        return specs.MAEnvironmentSpec(
+            environment=None,
+            specs=agent_specs,
+            extra_specs=environment_spec.extra_specs,
+        )
 
     def covert_specs(self, spec: Dict[str, Any], num_networks: int) -> Dict[str, Any]:
         if type(spec) is not dict:
             return spec
 
-        agents = sort_str_num(self._config.agent_net_keys.keys())[:num_networks]
+        agents = self._sorted_agent_keys[:num_networks]
         converted_spec: Dict[str, Any] = {}
         if agents[0] in spec.keys():
             for agent in agents:
@@ -273,22 +295,29 @@ class MADDPGBuilder:
 
         # Create table per trainer
         replay_tables = []
+        # Tables expecting the same number of networks share a signature,
+        # so only build it once per num_networks.
+        signatures: Dict[int, Any] = {}
         for table_key in self._config.table_network_config.keys():
             # TODO (dries): Clean the below coverter code up.
             # Convert a Mava spec
             num_networks = len(self._config.table_network_config[table_key])
-            env_spec = copy.deepcopy(env_adder_spec)
-            env_spec._specs = self.covert_specs(env_spec._specs, num_networks)
-
-            env_spec._keys = list(sort_str_num(env_spec._specs.keys()))
-            if env_spec.extra_specs is not None:
-                env_spec.extra_specs = self.covert_specs(
-                    env_spec.extra_specs, num_networks
+            if num_networks not in signatures:
+                # A shallow copy is enough since the converted specs below are
+                # assigned to new dicts and never mutate env_adder_spec.
+                env_spec = copy.copy(env_adder_spec)
+                env_spec._specs = self.covert_specs(env_spec._specs, num_networks)
+
+                env_spec._keys = list(sort_str_num(env_spec._specs.keys()))
+                if env_spec.extra_specs is not None:
+                    env_spec.extra_specs = self.covert_specs(
+                        env_spec.extra_specs, num_networks
+                    )
+                extra_specs = self.covert_specs(
+                    self._extra_specs,
+                    num_networks,
                 )
-            extra_specs = self.covert_specs(
-                self._extra_specs,
-                num_networks,
-            )
+                signatures[num_networks] = adder_sig_fn(env_spec, extra_specs)
 
             replay_tables.append(
                 reverb.Table(
@@ -297,7 +326,7 @@ class MADDPGBuilder:
                     remover=reverb.selectors.Fifo(),
                     max_size=self._config.max_replay_size,
                     rate_limiter=limiter_fn(),
-                    signature=adder_sig_fn(env_spec, extra_specs),
+                    signature=signatures[num_networks],
                 )
             )
         return replay_tables
@@ -329,8 +358,14 @@ class MADDPGBuilder:
             server_address=replay_client.server_address,
             batch_size=self._config.batch_size,
             prefetch_size=self._config.prefetch_size,
+            num_parallel_calls=self._config.num_parallel_calls,
             sequence_length=sequence_length,
         )
+
+        if self._config.prefetch_to_device:
+            dataset = dataset.apply(
+                tf.data.experimental.prefetch_to_device(self._config.prefetch_to_device)
+            )
         return iter(dataset)
 
     def make_adder(
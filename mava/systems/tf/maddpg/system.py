@@ -108,6 +108,8 @@ class MADDPG:
         termination_condition: Optional[Dict[str, int]] = None,
         evaluator_interval: Optional[dict] = None,
         learning_rate_scheduler_fn: Optional[Dict[str, Callable[[int], None]]] = None,
+        prefetch_to_device: Optional[str] = None,
+        num_parallel_calls: int = 12,
     ):
         """Initialise the system
         Args:
@@ -158,7 +160,10 @@ class MADDPG:
             min_replay_size: minimum replay size before updating.
             max_replay_size: maximum replay size.
             samples_per_insert: number of samples to take
-                from replay for every insert that is made.
+                from replay for every insert that is made. If None, only
+                min_replay_size is enforced, so executors keep collecting
+                without being throttled by the trainer (asynchronous
+                off-policy collection).
             policy_optimizer: optimizer(s) for updating policy networks.
             critic_optimizer: optimizer for updating critic
                 networks.
@@ -204,6 +209,11 @@ class MADDPG:
                 happen at every timestep.
                 E.g. to evaluate a system after every 100 executor episodes,
                 evaluator_interval = {"executor_episodes": 100}.
+            prefetch_to_device: optional device, e.g. "/GPU:0", to prefetch
+                sampled batches onto so that host to device copies overlap with
+                the trainer step. Defaults to None (host-side prefetch only).
+            num_parallel_calls: number of parallel replay sampling streams that
+                are interleaved to build the trainer dataset.
         """
 
         if not environment_spec:
@@ -375,6 +385,8 @@ class MADDPG:
                 discount=discount,
                 batch_size=batch_size,
                 prefetch_size=prefetch_size,
+                prefetch_to_device=prefetch_to_device,
+                num_parallel_calls=num_parallel_calls,
                 target_averaging=target_averaging,
                 target_update_period=target_update_period,
                 target_update_rate=target_update_rate,
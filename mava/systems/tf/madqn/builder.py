@@ -143,7 +143,7 @@ class MADQNBuilder:
         config: MADQNConfig,
         trainer_fn: Type[Trainer] = training.MADQNTrainer,
         executor_fn: Type[core.Executor] = MADQNFeedForwardExecutor,
-        extra_specs: Dict[str, Any] = {},
+        extra_specs: Optional[Dict[str, Any]] = None,
     ):
         """Initialise the builder.
 
@@ -159,9 +159,10 @@ class MADQNBuilder:
         """
 
         self._config = config
-        self._extra_specs = extra_specs
+        self._extra_specs = extra_specs if extra_specs is not None else {}
         self._agents = self._config.environment_spec.get_agent_ids()
         self._agent_types = self._config.environment_spec.get_agent_types()
+        self._sorted_agent_keys = sort_str_num(self._config.agent_net_keys.keys())
         self._trainer_fn = trainer_fn
         self._executor_fn = executor_fn
 
@@ -178,7 +179,7 @@ class MADQNBuilder:
         if type(spec) is not dict:
             return spec
 
-        agents = sort_str_num(self._config.agent_net_keys.keys())[:num_networks]
+        agents = self._sorted_agent_keys[:num_networks]
         converted_spec: Dict[str, Any] = {}
         if agents[0] in spec.keys():
             for agent in agents:
@@ -247,22 +248,29 @@ class MADQNBuilder:
 
         # Create table per trainer
         replay_tables = []
+        # Tables expecting the same number of networks share a signature,
+        # so only build it once per num_networks.
+        signatures: Dict[int, Any] = {}
         for table_key in self._config.table_network_config.keys():
             # TODO (dries): Clean the below coverter code up.
             # Convert a Mava spec
             num_networks = len(self._config.table_network_config[table_key])
-            env_spec = copy.deepcopy(environment_spec)
-            env_spec._specs = self.covert_specs(env_spec._specs, num_networks)
-
-            env_spec._keys = list(sort_str_num(env_spec._specs.keys()))
-            if env_spec.extra_specs is not None:
-                env_spec.extra_specs = self.covert_specs(
-                    env_spec.extra_specs, num_networks
+            if num_networks not in signatures:
+                # A shallow copy is enough since the converted specs below are
+                # assigned to new dicts and never mutate environment_spec.
+                env_spec = copy.copy(environment_spec)
+                env_spec._specs = self.covert_specs(env_spec._specs, num_networks)
+
+                env_spec._keys = list(sort_str_num(env_spec._specs.keys()))
+                if env_spec.extra_specs is not None:
+                    env_spec.extra_specs = self.covert_specs(
+                        env_spec.extra_specs, num_networks
+                    )
+                extra_specs = self.covert_specs(
+                    self._extra_specs,
+                    num_networks,
                 )
-            extra_specs = self.covert_specs(
-                self._extra_specs,
-                num_networks,
-            )
+                signatures[num_networks] = adder_sig_fn(env_spec, extra_specs)
 
             replay_tables.append(
                 reverb.Table(
@@ -271,7 +279,7 @@ class MADQNBuilder:
                     remover=reverb.selectors.Fifo(),
                     max_size=self._config.max_replay_size,
                     rate_limiter=limiter_fn(),
-                    signature=adder_sig_fn(env_spec, extra_specs),
+                    signature=signatures[num_networks],
                 )
             )
         return replay_tables
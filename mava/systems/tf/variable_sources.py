@@ -1,6 +1,8 @@
+import itertools
 import os
+import threading
 import time
-from typing import Any, Dict, Sequence, Union
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
 
 import launchpad as lp
 import numpy as np
@@ -40,13 +42,30 @@ class VariableSource:
             self._termination_condition
         )
 
+        # Numpy copies of the variables, tagged with the write version they were
+        # taken at. Reads of unchanged variables reuse these instead of
+        # converting the tf.Variables again.
+        self._numpy_cache: Dict[str, Tuple[int, Any]] = {}
+        self._write_counter = itertools.count(1)
+        self._write_versions: Dict[str, int] = {key: 0 for key in self.variables}
+        # Set whenever a variable is updated, so that run only checkpoints
+        # when there is something new to save.
+        self._checkpoint_event = threading.Event()
+
+        # Traced update functions, keyed by the variable names they update and
+        # whether they add to or overwrite the variables.
+        self._update_fns: Dict[
+            Tuple[Tuple[str, ...], bool], Tuple[List[tf.Variable], Callable]
+        ] = {}
+
         if checkpoint:
             # Only save variables that are not empty.
             save_variables = {}
             for key in self.variables.keys():
                 var = self.variables[key]
-                # Don't store empty tuple (e.g. empty observation_network) variables
-                if not (type(var) == tuple and len(var) == 0):
+                # Don't store empty (e.g. empty observation_network) variables,
+                # however deeply they are nested.
+                if tf.nest.flatten(var):
                     save_variables[key] = variables[key]
 
             # Create checkpointer
@@ -69,17 +88,79 @@ class VariableSource:
             variables(Dict[str, Dict[str, np.ndarray]]): The variables that
             were requested.
         """
-        if type(names) == str:
+        if isinstance(names, str):
             return self.variables[names]  # type: ignore
         else:
             variables: Dict[str, Dict[str, np.ndarray]] = {}
             for var_key in names:
-                # TODO (dries): Do we really have to convert the variables to
-                # numpy each time. Can we not keep the variables in numpy form
-                # without the checkpointer complaining?
-                variables[var_key] = tf2_utils.to_numpy(self.variables[var_key])
+                # Read the version before converting, so that a concurrent write
+                # leaves the cached copy stale instead of wrongly marking it
+                # as current.
+                version = self._write_versions[var_key]
+                cached = self._numpy_cache.get(var_key)
+                if cached is not None and cached[0] == version:
+                    variables[var_key] = cached[1]
+                else:
+                    numpy_var = tf2_utils.to_numpy(self.variables[var_key])
+                    self._numpy_cache[var_key] = (version, numpy_var)
+                    variables[var_key] = numpy_var
             return variables
 
+    def _mark_updated(self, var_key: str) -> None:
+        """Invalidate the cached numpy copy of an updated variable.
+        Args:
+            var_key (str): Name of the variable that was updated.
+        Returns:
+            None
+        """
+        self._write_versions[var_key] = next(self._write_counter)
+        self._checkpoint_event.set()
+
+    def _update_variables(
+        self, names: Sequence[str], vars: Dict[str, Any], add: bool
+    ) -> None:
+        """Assign or add values to variables in a single traced call.
+        Args:
+            names (Sequence[str]): Names of the variables to update.
+            vars(Dict[str, Any]): The values to update the variables with.
+            add (bool): Whether to add the values instead of assigning them.
+        Returns:
+            None
+        """
+        key = (tuple(names), add)
+        if key not in self._update_fns:
+            for var_key in names:
+                assert var_key in self.variables
+            flat_vars = tf.nest.flatten([self.variables[k] for k in names])
+
+            @tf.function
+            def update_fn(flat_values: List[tf.Tensor]) -> None:
+                for var, value in zip(flat_vars, flat_values):
+                    if add:
+                        var.assign_add(value)
+                    else:
+                        var.assign(value)
+
+            self._update_fns[key] = (flat_vars, update_fn)
+
+        flat_vars, update_fn = self._update_fns[key]
+        flat_values = tf.nest.flatten([vars[k] for k in names])
+        # zip below would silently drop the extra leaves of a mismatched update.
+        assert len(flat_values) == len(flat_vars), (
+            f"Got {len(flat_values)} values to update {list(names)} with, "
+            f"but they hold {len(flat_vars)} variables."
+        )
+        # Convert to the variable dtypes up front, as assign would, so that
+        # Python scalars do not cause a retrace for every new value.
+        update_fn(
+            [
+                tf.convert_to_tensor(value, dtype=var.dtype)
+                for var, value in zip(flat_vars, flat_values)
+            ]
+        )
+        for var_key in names:
+            self._mark_updated(var_key)
+
     def set_variables(self, names: Sequence[str], vars: Dict[str, np.ndarray]) -> None:
         """Set variables in the variable source.
         Args:
@@ -88,19 +169,11 @@ class VariableSource:
         Returns:
             None
         """
-        if type(names) == str:
+        if isinstance(names, str):
             vars = {names: vars}  # type: ignore
             names = [names]  # type: ignore
 
-        for var_key in names:
-            assert var_key in self.variables
-            if type(self.variables[var_key]) == tuple:
-                # Loop through tuple
-                for var_i in range(len(self.variables[var_key])):
-                    self.variables[var_key][var_i].assign(vars[var_key][var_i])
-            else:
-                self.variables[var_key].assign(vars[var_key])
-        return
+        self._update_variables(names, vars, add=False)
 
     def add_to_variables(
         self, names: Sequence[str], vars: Dict[str, np.ndarray]
@@ -112,16 +185,34 @@ class VariableSource:
         Returns:
             None
         """
-        if type(names) == str:
+        if isinstance(names, str):
             vars = {names: vars}  # type: ignore
             names = [names]  # type: ignore
 
-        for var_key in names:
-            assert var_key in self.variables
-            # Note: Can also use self.variables[var_key] = /
-            # self.variables[var_key] + vars[var_key]
-            self.variables[var_key].assign_add(vars[var_key])
-        return
+        self._update_variables(names, vars, add=True)
+
+    def _checkpoint_if_updated(self) -> None:
+        """Checkpoint the variables if they changed and the interval has passed.
+        Args:
+            None
+        Returns:
+            None
+        """
+        # Add 1 extra second just to make sure that the checkpointer
+        # is ready to save.
+        # Skip the checkpoint if no variables changed since the last one.
+        if (
+            self._system_checkpointer
+            and self._checkpoint_event.is_set()
+            and self._last_checkpoint_time + self._checkpoint_minute_interval * 60 + 1
+            < time.time()
+        ):
+            self._checkpoint_event.clear()
+            if self._system_checkpointer.save():
+                self._last_checkpoint_time = time.time()
+                print("Updated variables checkpoint.")
+            else:
+                self._checkpoint_event.set()
 
     def run(self) -> None:
         """Run the variable source. This function allows for
@@ -137,17 +228,7 @@ class VariableSource:
             # Wait 10 seconds before checking again
             non_blocking_sleep(10)
 
-            # Add 1 extra second just to make sure that the checkpointer
-            # is ready to save.
-            if (
-                self._system_checkpointer
-                and self._last_checkpoint_time
-                + self._checkpoint_minute_interval * 60
-                + 1
-                < time.time()
-            ):
-                self._system_checkpointer.save()
-                print("Updated variables checkpoint.")
+            self._checkpoint_if_updated()
 
             if self._termination_condition is not None:
                 current_count = float(self.variables[self._terminal_key])
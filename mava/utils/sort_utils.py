@@ -5,9 +5,7 @@ from typing import Any, Dict, List, Tuple
 import numpy as np
 from numpy.random import randint
 
-
-def atoi(text: str) -> object:
-    return int(text) if text.isdigit() else text
+_DIGITS = re.compile(r"(\d+)")
 
 
 def natural_keys(text: str) -> List:
@@ -16,7 +14,11 @@ def natural_keys(text: str) -> List:
     http://nedbatchelder.com/blog/200712/human_sorting.html
     (See Toothy's implementation in the comments)
     """
-    return [atoi(c) for c in re.split(r"(\d+)", text)]
+    # Splitting on a capture group always places the digit runs at the odd
+    # indices, so they can be converted in one pass without testing each part.
+    keys: List[Any] = _DIGITS.split(text)
+    keys[1::2] = map(int, keys[1::2])
+    return keys
 
 
 def sort_str_num(str_num: Any) -> List[Any]:
@@ -18,6 +18,13 @@ from typing_extensions import TypedDict
 
 from mava import types
 
+# Shared, read-only terminal flags, so observations do not allocate a new array
+# for every agent on every step.
+_TERMINAL_TRUE = np.ones((1,), dtype=np.float32)
+_TERMINAL_TRUE.setflags(write=False)
+_TERMINAL_FALSE = np.zeros((1,), dtype=np.float32)
+_TERMINAL_FALSE.setflags(write=False)
+
 SeqTimestepDict = TypedDict(
     "SeqTimestepDict",
     {"timestep": dm_env.TimeStep, "action": types.Action},
@@ -100,11 +107,23 @@ def convert_dm_compatible_observations(
         observations[agent] = types.OLT(
             observation=observation,
             legal_actions=legals,
-            terminal=np.asarray([terminal], dtype=np.float32),
+            terminal=convert_terminal(terminal),
         )
     return observations
 
 
+def convert_terminal(done: bool) -> np.ndarray:
+    """Converts a done flag to a read-only terminal array.
+
+    Args:
+        done : whether the agent is done.
+
+    Returns:
+        a shared, read-only float32 array of shape (1,).
+    """
+    return _TERMINAL_TRUE if done else _TERMINAL_FALSE
+
+
 def generate_zeros_from_spec(spec: specs.Array) -> np.ndarray:
     """Generate zeros following a specific spec.
 
@@ -244,6 +263,7 @@ class RunningStatistics:
     # The queue_size is used to estimate a moving mean and variance value.
     def __init__(self, label: str, queue_size: int = 100) -> None:
 
+        self._queue_size = queue_size
         self.queue: collections.deque = collections.deque(maxlen=queue_size)
         self._max = -float("inf")
         self._min = float("inf")
@@ -256,9 +276,16 @@ class RunningStatistics:
 
         self._raw = 0.0
 
+        # Sum of squared deviations from the mean over the window, updated with
+        # Welford's method so large offsets do not cancel out the variance.
+        self._m2 = 0.0
+        self._num_pushes = 0
+
     def push(self, x: float) -> None:
+        # Convert once, so that tensors are not converted again every time the
+        # window statistics are computed.
+        x = float(x)
         self._raw = x
-        self.queue.append(x)
 
         if x > self._max:
             self._max = x
@@ -266,12 +293,31 @@ class RunningStatistics:
         if x < self._min:
             self._min = x
 
+        if len(self.queue) == self._queue_size:
+            # Sliding window: replace the oldest value with x.
+            oldest = self.queue[0]
+            self.queue.append(x)
+            old_mean = self._mean
+            self._mean = old_mean + (x - oldest) / len(self.queue)
+            self._m2 += (x - oldest) * (x - self._mean + oldest - old_mean)
+        else:
+            self.queue.append(x)
+            delta = x - self._mean
+            self._mean += delta / len(self.queue)
+            self._m2 += delta * (x - self._mean)
+
+        # Recompute exactly once per window to stop rounding errors building up.
+        self._num_pushes += 1
+        if self._num_pushes % self._queue_size == 0:
+            self._mean = sum(self.queue) / len(self.queue)
+            self._m2 = sum((value - self._mean) ** 2 for value in self.queue)
+
         if len(self.queue) == 1:
             self._mean = x
+            self._m2 = 0.0
             self._var = 0
         else:
-            self._mean = np.mean(self.queue)
-            self._var = np.var(self.queue)
+            self._var = max(self._m2, 0.0) / len(self.queue)
 
     def max(self) -> float:
         return self._max
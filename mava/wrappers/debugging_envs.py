@@ -14,7 +14,7 @@
 # limitations under the License.
 
 """Wraps a Debugging MARL environment to be used as a dm_env environment."""
-from typing import Dict, Tuple, Union
+from typing import Any, Dict, Tuple, Union
 
 import dm_env
 import numpy as np
@@ -42,29 +42,37 @@ class DebuggingEnvWrapper(PettingZooParallelEnvWrapper):
 
         self.return_state_info = return_state_info
 
+        # Reward conversions are the same every step, so they are set up on the
+        # first reset. step always resets first, as _reset_next_step starts True.
+        self._reward_types: Dict[str, Any] = {}
+        self._empty_step_rewards: Dict[str, Any] = {}
+
     def reset(self) -> dm_env.TimeStep:
         """Resets the episode."""
         self._reset_next_step = False
         self._step_type = dm_env.StepType.FIRST
-        discount_spec = self.discount_spec()
-        self._discounts = {
-            agent: convert_np_type(discount_spec[agent].dtype, 1)
-            for agent in self._environment.possible_agents
-        }
+        zero_rewards, discounts = self._build_restart_dicts()
+        if not self._reward_types:
+            rewards_spec = self.reward_spec()
+            self._reward_types = {
+                agent: np.dtype(spec.dtype).type for agent, spec in rewards_spec.items()
+            }
+            self._empty_step_rewards = {
+                agent: convert_np_type(rewards_spec[agent].dtype, 0)
+                for agent in self.agent_ids
+            }
         observe, env_extras = self._environment.reset()
 
         observations = self._convert_observations(
             observe, {agent: False for agent in self.possible_agents}
         )
-        rewards_spec = self.reward_spec()
-        rewards = {
-            agent: convert_np_type(rewards_spec[agent].dtype, 0)
-            for agent in self.possible_agents
-        }
         if not self.return_state_info:
             env_extras = {}
 
-        return parameterized_restart(rewards, self._discounts, observations), env_extras
+        return (
+            parameterized_restart(zero_rewards, discounts, observations),
+            env_extras,
+        )
 
     def step(
         self, actions: Dict[str, np.ndarray]
@@ -76,17 +84,14 @@ class DebuggingEnvWrapper(PettingZooParallelEnvWrapper):
 
         observations, rewards, dones, state = self._environment.step(actions)
 
-        rewards_spec = self.reward_spec()
         #  Handle empty rewards
         if not rewards:
-            rewards = {
-                agent: convert_np_type(rewards_spec[agent].dtype, 0)
-                for agent in self.agent_ids
-            }
+            # Shared across timesteps, like the discounts, so it is not copied.
+            rewards = self._empty_step_rewards
         else:
+            reward_types = self._reward_types
             rewards = {
-                agent: convert_np_type(rewards_spec[agent].dtype, reward)
-                for agent, reward in rewards.items()
+                agent: reward_types[agent](reward) for agent, reward in rewards.items()
             }
 
         if observations:
@@ -271,28 +276,14 @@ class TwoStepWrapper(PettingZooParallelEnvWrapper):
         """Resets the episode."""
         self._reset_next_step = False
         self._step_type = dm_env.StepType.FIRST
-        discount_spec = self.discount_spec()
-        self._discounts = {
-            agent: convert_np_type(discount_spec[agent].dtype, 1)
-            for agent in self._environment.possible_agents
-        }
+        zero_rewards, discounts = self._build_restart_dicts()
         observe, state_infos = self._environment.reset()
         observations = self._convert_observations(
             observe, {agent: False for agent in self.possible_agents}
         )
-        rewards_spec = self.reward_spec()
-        rewards = {
-            agent: convert_np_type(rewards_spec[agent].dtype, 0)
-            for agent in self.possible_agents
-        }
-
-        discount_spec = self.discount_spec()
-        self._discounts = {
-            agent: convert_np_type(discount_spec[agent].dtype, 1)
-            for agent in self.possible_agents
-        }
+
         return (
-            parameterized_restart(rewards, self._discounts, observations),
+            parameterized_restart(zero_rewards, discounts, observations),
             state_infos,
         )
 
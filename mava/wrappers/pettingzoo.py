@@ -15,7 +15,7 @@
 
 """Wraps a PettingZoo MARL environment to be used as a dm_env environment."""
 import copy
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import dm_env
 import gym
@@ -36,6 +36,7 @@ from mava.utils.wrapper_utils import (
     apply_env_wrapper_preprocessors,
     convert_dm_compatible_observations,
     convert_np_type,
+    convert_terminal,
     parameterized_restart,
 )
 from mava.wrappers.env_wrappers import ParallelEnvWrapper, SequentialEnvWrapper
@@ -65,6 +66,18 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
         self.correct_agent_name()
         self.last_turn_agent = None
 
+        # Specs and default legal actions are static, so they are built on first
+        # use and reused on every step.
+        self._observation_specs: Optional[Dict[str, types.OLT]] = None
+        self._action_specs: Optional[Dict[str, specs.DiscreteArray]] = None
+        self._reward_specs: Optional[Dict[str, specs.Array]] = None
+        self._discount_specs: Optional[Dict[str, specs.BoundedArray]] = None
+        self._default_legals: Dict[str, np.ndarray] = {}
+        # Numpy scalar types used to convert rewards and discounts per agent.
+        self._reward_types: Dict[str, Any] = {}
+        self._discount_types: Dict[str, Any] = {}
+        self._possible_agents: Optional[List] = None
+
     def reset(self) -> dm_env.TimeStep:
         """Resets the env.
 
@@ -82,9 +95,19 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
         agent = self.current_agent
         observation = self._convert_observation(agent, observe, done)
 
-        self._discount = convert_np_type(self.discount_spec()[agent].dtype, 1)
+        if not self._reward_types:
+            self._reward_types = {
+                agent: np.dtype(spec.dtype).type
+                for agent, spec in self.reward_spec().items()
+            }
+            self._discount_types = {
+                agent: np.dtype(spec.dtype).type
+                for agent, spec in self.discount_spec().items()
+            }
 
-        reward = convert_np_type(self.reward_spec()[agent].dtype, 0)
+        self._discount = self._discount_types[agent](1)
+
+        reward = self._reward_types[agent](0)
 
         return parameterized_restart(reward, self._discount, observation)
 
@@ -100,7 +123,9 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
         if self._reset_next_step:
             return self.reset()
 
-        _, _, done, _ = self._environment.last()
+        # Only the done flag is needed here, so read it directly rather than
+        # building the current agent's observation through last().
+        done = self._environment.dones[self.current_agent]
 
         # If current agent is done
         if done:
@@ -112,7 +137,7 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
         # Reset if all agents are done
         if self.env_done():
             self._reset_next_step = True
-            reward = convert_np_type(self.reward_spec()[agent].dtype, 0)
+            reward = self._reward_types[agent](0)
             observation = self._convert_observation(
                 agent, self._environment.observe(agent), done
             )
@@ -121,7 +146,7 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
             observe, reward, done, info = self._environment.last()
 
             # Convert rewards to match spec
-            reward = convert_np_type(self.reward_spec()[agent].dtype, reward)
+            reward = self._reward_types[agent](reward)
             observation = self._convert_observation(agent, observe, done)
 
         step_type = dm_env.StepType.LAST if done else dm_env.StepType.MID
@@ -145,7 +170,7 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
         """Agent iterator to loop through agents.
 
         Args:
-            max_iter (int, optional): max iterations. Defaults to 2**63.
+            max_iter (int, optional): max iterations. Defaults to 2 ** 63.
 
         Returns:
             Iterator: agent iter.
@@ -174,10 +199,13 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
             legals = observe["action_mask"]
             observation = observe["observation"]
         elif isinstance(observe, np.ndarray):
-            legals = np.ones(
-                self._environment.action_spaces[agent].shape,
-                dtype=self._environment.action_spaces[agent].dtype,
-            )
+            if agent not in self._default_legals:
+                action_space = self._environment.action_spaces[agent]
+                default_legals = np.ones(action_space.shape, dtype=action_space.dtype)
+                # Shared across steps, so make sure it is never modified.
+                default_legals.setflags(write=False)
+                self._default_legals[agent] = default_legals
+            legals = self._default_legals[agent]
             observation = observe
 
         if observation is not None and observation.dtype == np.int8:
@@ -190,7 +218,7 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
         observation_olt = types.OLT(
             observation=observation,
             legal_actions=legals,
-            terminal=np.asarray([done], dtype=np.float32),
+            terminal=convert_terminal(done),
         )
         return observation_olt
 
@@ -227,6 +255,9 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
         Returns:
             types.Observation: spec for observations.
         """
+        if self._observation_specs is not None:
+            return self._observation_specs
+
         observation_specs = {}
         for agent in self._environment.possible_agents:
             if isinstance(self._environment.observation_spaces[agent], gym.spaces.Dict):
@@ -250,6 +281,7 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
                 legal_actions=_convert_to_spec(legal_actions_space),
                 terminal=specs.Array((1,), np.float32),
             )
+        self._observation_specs = observation_specs
         return observation_specs
 
     def action_spec(self) -> Dict[str, specs.DiscreteArray]:
@@ -258,11 +290,15 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
         Returns:
             Dict[str, specs.DiscreteArray]: spec for actions.
         """
+        if self._action_specs is not None:
+            return self._action_specs
+
         action_specs = {}
         for agent in self.possible_agents:
             action_specs[agent] = _convert_to_spec(
                 self._environment.action_spaces[agent]
             )
+        self._action_specs = action_specs
         return action_specs
 
     def reward_spec(self) -> Dict[str, specs.Array]:
@@ -271,10 +307,14 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
         Returns:
             Dict[str, specs.Array]: Spec for rewards.
         """
+        if self._reward_specs is not None:
+            return self._reward_specs
+
         reward_specs = {}
         for agent in self.possible_agents:
             reward_specs[agent] = specs.Array((), np.float32)
 
+        self._reward_specs = reward_specs
         return reward_specs
 
     def discount_spec(self) -> Dict[str, specs.BoundedArray]:
@@ -283,11 +323,15 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
         Returns:
             Dict[str, specs.BoundedArray]: spec for discounts.
         """
+        if self._discount_specs is not None:
+            return self._discount_specs
+
         discount_specs = {}
         for agent in self.possible_agents:
             discount_specs[agent] = specs.BoundedArray(
                 (), np.float32, minimum=0, maximum=1.0
             )
+        self._discount_specs = discount_specs
         return discount_specs
 
     def extra_spec(self) -> Dict[str, specs.BoundedArray]:
@@ -314,7 +358,11 @@ class PettingZooAECEnvWrapper(SequentialEnvWrapper):
         Returns:
             List: all possible agents in env.
         """
-        return self._environment.possible_agents
+        # Possible agents are fixed, so avoid going through the (possibly
+        # wrapped) environment on every access.
+        if self._possible_agents is None:
+            self._possible_agents = self._environment.possible_agents
+        return self._possible_agents
 
     @property
     def environment(self) -> "AECEnv":
@@ -386,6 +434,21 @@ class PettingZooParallelEnvWrapper(ParallelEnvWrapper):
                 self._environment, env_preprocess_wrappers
             )
 
+        # Specs are static, so they are built on first use and reused on every
+        # step.
+        self._observation_specs: Optional[Dict[str, types.OLT]] = None
+        self._action_specs: Optional[
+            Dict[str, Union[specs.DiscreteArray, specs.BoundedArray]]
+        ] = None
+        self._reward_specs: Optional[Dict[str, specs.Array]] = None
+        self._discount_specs: Optional[Dict[str, specs.BoundedArray]] = None
+        self._reward_dtype: Optional[np.dtype] = None
+        # Built once and shared by every timestep, so they must not be modified.
+        self._discounts: Optional[Dict[str, float]] = None
+        self._terminal_discounts: Optional[Dict[str, float]] = None
+        self._zero_rewards: Optional[Dict[str, float]] = None
+        self._possible_agents: Optional[List] = None
+
     def reset(self) -> dm_env.TimeStep:
         """Resets the env.
 
@@ -395,13 +458,9 @@ class PettingZooParallelEnvWrapper(ParallelEnvWrapper):
 
         self._reset_next_step = False
         self._step_type = dm_env.StepType.FIRST
-        discount_spec = self.discount_spec()
         observe = self._environment.reset()
 
-        self._discounts = {
-            agent: convert_np_type(discount_spec[agent].dtype, 1)
-            for agent in self.possible_agents
-        }
+        zero_rewards, discounts = self._build_restart_dicts()
 
         if self._return_state_info and type(observe) == tuple:
             observe, state = observe
@@ -411,23 +470,50 @@ class PettingZooParallelEnvWrapper(ParallelEnvWrapper):
         observations = self._convert_observations(
             observe, {agent: False for agent in self.possible_agents}
         )
-        rewards_spec = self.reward_spec()
-        rewards = {
-            agent: convert_np_type(rewards_spec[agent].dtype, 0)
-            for agent in self.possible_agents
-        }
 
         # If we want state information and it has not been provided as part of
         # the env reset - e.g. smac.
         if not state:
             state = self.get_state()
 
+        timestep = parameterized_restart(zero_rewards, discounts, observations)
         if state is not None:
-            return parameterized_restart(rewards, self._discounts, observations), {
-                "s_t": state
-            }
+            return timestep, {"s_t": state}
         else:
-            return parameterized_restart(rewards, self._discounts, observations)
+            return timestep
+
+    def _build_restart_dicts(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """Builds the discount and reward dicts shared by every episode.
+
+        They only depend on the specs, so they are built on the first reset.
+
+        Returns:
+            Tuple[Dict[str, float], Dict[str, float]]: first step rewards and
+                discounts.
+        """
+        if self._zero_rewards is None or self._discounts is None:
+            discount_spec = self.discount_spec()
+            self._discounts = {
+                agent: convert_np_type(discount_spec[agent].dtype, 1)
+                for agent in self.possible_agents
+            }
+            # Terminal discount should be 0.0 as per dm_env
+            self._terminal_discounts = {
+                agent: convert_np_type(discount_spec[agent].dtype, 0.0)
+                for agent in self.possible_agents
+            }
+            rewards_spec = self.reward_spec()
+            self._zero_rewards = {
+                agent: convert_np_type(rewards_spec[agent].dtype, 0)
+                for agent in self.possible_agents
+            }
+
+            # Rewards can be converted in one go when every agent shares a dtype.
+            reward_dtypes = {np.dtype(spec.dtype) for spec in rewards_spec.values()}
+            if len(reward_dtypes) == 1:
+                self._reward_dtype = reward_dtypes.pop()
+
+        return self._zero_rewards, self._discounts
 
     def step(self, actions: Dict[str, np.ndarray]) -> dm_env.TimeStep:
         """Steps in env.
@@ -454,11 +540,7 @@ class PettingZooParallelEnvWrapper(ParallelEnvWrapper):
         if self.env_done():
             self._step_type = dm_env.StepType.LAST
             self._reset_next_step = True
-            # Terminal discount should be 0.0 as per dm_env
-            discount = {
-                agent: convert_np_type(self.discount_spec()[agent].dtype, 0.0)
-                for agent in self.possible_agents
-            }
+            discount = self._terminal_discounts
         else:
             self._step_type = dm_env.StepType.MID
             discount = self._discounts
@@ -515,6 +597,15 @@ class PettingZooParallelEnvWrapper(ParallelEnvWrapper):
         Args:
             rewards (Dict[str, float]): rewards per agent.
         """
+        if self._reward_dtype is not None:
+            possible_agents = self.possible_agents
+            converted_rewards = np.fromiter(
+                (rewards.get(agent, 0) for agent in possible_agents),
+                dtype=self._reward_dtype,
+                count=len(possible_agents),
+            )
+            return dict(zip(possible_agents, converted_rewards))
+
         rewards_spec = self.reward_spec()
         rewards_return = {}
         for agent in self.possible_agents:
@@ -553,6 +644,9 @@ class PettingZooParallelEnvWrapper(ParallelEnvWrapper):
         Returns:
             types.Observation: spec for environment.
         """
+        if self._observation_specs is not None:
+            return self._observation_specs
+
         observation_specs = {}
         for agent in self.possible_agents:
             if type(self._environment.observation_spaces[agent]) == spaces.Box:
@@ -589,6 +683,7 @@ class PettingZooParallelEnvWrapper(ParallelEnvWrapper):
                 terminal=specs.Array((1,), np.float32),
             )
 
+        self._observation_specs = observation_specs
         return observation_specs
 
     def action_spec(self) -> Dict[str, Union[specs.DiscreteArray, specs.BoundedArray]]:
@@ -597,10 +692,14 @@ class PettingZooParallelEnvWrapper(ParallelEnvWrapper):
         Returns:
             Dict[str, Union[specs.DiscreteArray, specs.BoundedArray]]: spec for actions.
         """
+        if self._action_specs is not None:
+            return self._action_specs
+
         action_specs = {}
         action_spaces = self._environment.action_spaces
         for agent in self.possible_agents:
             action_specs[agent] = _convert_to_spec(action_spaces[agent])
+        self._action_specs = action_specs
         return action_specs
 
     def reward_spec(self) -> Dict[str, specs.Array]:
@@ -609,10 +708,14 @@ class PettingZooParallelEnvWrapper(ParallelEnvWrapper):
         Returns:
             Dict[str, specs.Array]: spec for rewards.
         """
+        if self._reward_specs is not None:
+            return self._reward_specs
+
         reward_specs = {}
         for agent in self.possible_agents:
             reward_specs[agent] = specs.Array((), np.float32)
 
+        self._reward_specs = reward_specs
         return reward_specs
 
     def discount_spec(self) -> Dict[str, specs.BoundedArray]:
@@ -621,11 +724,15 @@ class PettingZooParallelEnvWrapper(ParallelEnvWrapper):
         Returns:
             Dict[str, specs.BoundedArray]: spec for discounts.
         """
+        if self._discount_specs is not None:
+            return self._discount_specs
+
         discount_specs = {}
         for agent in self.possible_agents:
             discount_specs[agent] = specs.BoundedArray(
                 (), np.float32, minimum=0, maximum=1.0
             )
+        self._discount_specs = discount_specs
         return discount_specs
 
     def get_state(self) -> Optional[Dict]:
@@ -675,7 +782,11 @@ class PettingZooParallelEnvWrapper(ParallelEnvWrapper):
         Returns:
             List: all possible agents in env.
         """
-        return self._environment.possible_agents
+        # Possible agents are fixed, so avoid going through the (possibly
+        # wrapped) environment on every access.
+        if self._possible_agents is None:
+            self._possible_agents = self._environment.possible_agents
+        return self._possible_agents
 
     @property
     def environment(self) -> "ParallelEnv":
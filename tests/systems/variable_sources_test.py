@@ -0,0 +1,133 @@
+# python3
+# Copyright 2021 InstaDeep Ltd. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the variable source."""
+
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from mava.systems.tf.variable_sources import VariableSource
+
+
+def make_variable_source(checkpoint_dir: str = "") -> VariableSource:
+    variables = {
+        "trainer_steps": tf.Variable(0, dtype=tf.int32),
+        "weights": [tf.Variable(np.zeros((2,), dtype=np.float32))],
+        "pair": (
+            tf.Variable(1.0, dtype=tf.float32),
+            tf.Variable(np.ones((3,), dtype=np.float32)),
+        ),
+    }
+    return VariableSource(
+        variables=variables,
+        checkpoint=bool(checkpoint_dir),
+        checkpoint_subpath=checkpoint_dir,
+        checkpoint_minute_interval=0,
+    )
+
+
+class TestVariableSource:
+    # Test that get_variables returns newly set values instead of cached ones.
+    def test_set_then_get_returns_new_values(self) -> None:
+        variable_source = make_variable_source()
+
+        before: Dict[str, Any] = variable_source.get_variables(["weights"])
+        np.testing.assert_array_equal(before["weights"][0], [0.0, 0.0])
+
+        variable_source.set_variables(
+            ["weights"], {"weights": [np.array([1.0, 2.0], dtype=np.float32)]}
+        )
+        after: Dict[str, Any] = variable_source.get_variables(["weights"])
+        np.testing.assert_array_equal(after["weights"][0], [1.0, 2.0])
+
+    # Test add_to_variables on an int counter.
+    def test_add_to_int_counter(self) -> None:
+        variable_source = make_variable_source()
+
+        for _ in range(3):
+            variable_source.add_to_variables(["trainer_steps"], {"trainer_steps": 2})
+
+        counts: Dict[str, Any] = variable_source.get_variables(["trainer_steps"])
+        assert counts["trainer_steps"] == 6
+        assert variable_source.variables["trainer_steps"].dtype == tf.int32
+
+    # Test add_to_variables on a tuple-valued variable.
+    def test_add_to_tuple_variable(self) -> None:
+        variable_source = make_variable_source()
+
+        variable_source.add_to_variables(
+            ["pair"],
+            {"pair": (np.float32(0.5), np.array([1.0, 2.0, 3.0], dtype=np.float32))},
+        )
+
+        pair: Any = variable_source.get_variables(["pair"])["pair"]
+        assert isinstance(pair, tuple)
+        assert pair[0] == 1.5
+        np.testing.assert_array_equal(pair[1], [2.0, 3.0, 4.0])
+
+    # Test that an update with the wrong number of leaves is rejected.
+    def test_mismatched_update_raises(self) -> None:
+        variable_source = make_variable_source()
+
+        with pytest.raises(AssertionError):
+            variable_source.set_variables(["pair"], {"pair": (np.float32(0.5),)})
+
+        pair: Any = variable_source.get_variables(["pair"])["pair"]
+        assert pair[0] == 1.0
+
+    # Test that unchanged variables are served from the cache.
+    def test_unchanged_variable_is_cached(self) -> None:
+        variable_source = make_variable_source()
+
+        first: Dict[str, Any] = variable_source.get_variables(
+            ["weights", "trainer_steps"]
+        )
+        variable_source.add_to_variables(["trainer_steps"], {"trainer_steps": 1})
+        second: Dict[str, Any] = variable_source.get_variables(
+            ["weights", "trainer_steps"]
+        )
+
+        # The untouched variable is the same cached object, the updated one
+        # is converted again.
+        assert second["weights"] is first["weights"]
+        assert second["trainer_steps"] is not first["trainer_steps"]
+        assert second["trainer_steps"] == 1
+
+    # Test that writes set the checkpoint event and a save clears it.
+    def test_checkpoint_event(self, tmp_path: Path) -> None:
+        variable_source = make_variable_source(str(tmp_path))
+        assert not variable_source._checkpoint_event.is_set()
+
+        # Nothing changed, so nothing is saved.
+        variable_source._last_checkpoint_time -= 60
+        last_checkpoint_time = variable_source._last_checkpoint_time
+        variable_source._checkpoint_if_updated()
+        assert variable_source._last_checkpoint_time == last_checkpoint_time
+
+        variable_source.set_variables(
+            ["weights"], {"weights": [np.array([1.0, 2.0], dtype=np.float32)]}
+        )
+        assert variable_source._checkpoint_event.is_set()
+
+        variable_source._checkpoint_if_updated()
+        assert not variable_source._checkpoint_event.is_set()
+        assert variable_source._last_checkpoint_time > last_checkpoint_time
+
+        variable_source.add_to_variables(["trainer_steps"], {"trainer_steps": 1})
+        assert variable_source._checkpoint_event.is_set()
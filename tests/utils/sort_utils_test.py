@@ -0,0 +1,31 @@
+# python3
+# Copyright 2021 InstaDeep Ltd. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from mava.utils.sort_utils import natural_keys, sort_str_num
+
+
+class TestSortUtils:
+    # Test that natural_keys splits strings into text and integer parts.
+    def test_natural_keys(self) -> None:
+        assert natural_keys("agent_10") == ["agent_", 10, ""]
+        assert natural_keys("10abc") == ["", 10, "abc"]
+        assert natural_keys("a1b22c") == ["a", 1, "b", 22, "c"]
+        assert natural_keys("agent") == ["agent"]
+        assert natural_keys("") == [""]
+
+    # Test that sort_str_num sorts numbers in human order.
+    def test_sort_str_num(self) -> None:
+        keys = ["agent_10", "agent_2", "agent_1", "agent_0"]
+        assert sort_str_num(keys) == ["agent_0", "agent_1", "agent_2", "agent_10"]
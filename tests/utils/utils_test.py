@@ -15,10 +15,13 @@
 
 
 import numpy as np
+import pytest
 
 from mava.utils.wrapper_utils import (
+    RunningStatistics,
     broadcast_timestep_to_all_agents,
     convert_seq_timestep_and_actions_to_parallel,
+    convert_terminal,
 )
 from tests.utils.test_data import (
     get_expected_parallel_timesteps_1,
@@ -67,3 +70,27 @@ class TestUtils:
             parallel_actions,  # type: ignore
             expected_actions,  # type: ignore
         ), "Failed to convert seq actions to parallel."
+
+    # Test that RunningStatistics matches numpy over its moving window, including
+    # for values with a large offset relative to their spread.
+    @pytest.mark.parametrize("loc,scale", [(100.0, 2.0), (1e8, 1.0), (1e7, 0.5)])
+    def test_running_statistics(self, loc: float, scale: float) -> None:
+        values = np.random.RandomState(42).normal(loc=loc, scale=scale, size=250)
+        stats = RunningStatistics("test", queue_size=100)
+        for i, value in enumerate(values):
+            stats.push(value)
+            window = values[max(0, i - 99) : i + 1]
+            assert np.isclose(stats.mean(), np.mean(window))
+            assert np.isclose(stats.var(), np.var(window), rtol=1e-6)
+            assert stats.max() == np.max(values[: i + 1])
+            assert stats.min() == np.min(values[: i + 1])
+            assert stats.raw() == value
+
+    # Test that convert_terminal returns read-only float32 flags.
+    def test_convert_terminal(self) -> None:
+        for done, expected in [(True, 1.0), (False, 0.0)]:
+            terminal = convert_terminal(done)
+            assert terminal.shape == (1,)
+            assert terminal.dtype == np.float32
+            assert terminal[0] == expected
+            assert not terminal.flags.writeable
@@ -486,6 +486,14 @@ class TestEnvWrapper:
             monkeypatch.setattr(
                 wrapped_env._environment, "step", mock_step, raising=False
             )
+            # The wrapper reads the current agent's done flag from dones before
+            # stepping, so mark every agent as done there too.
+            monkeypatch.setattr(
+                wrapped_env._environment,
+                "dones",
+                {agent: True for agent in wrapped_env.possible_agents},
+                raising=False,
+            )
 
             for index, (agent) in enumerate(wrapped_env.agent_iter(n_agents)):
                 test_agent_actions = wrapped_env.action_spaces[agent].sample()